@@ -1,42 +1,82 @@
 # app.py
+import asyncio
+import logging
 from contextlib import asynccontextmanager
-from typing import Any, Optional, Sequence
+from hashlib import blake2b
+from typing import Annotated, Any, Optional, Sequence
 
-from fastapi import Depends, FastAPI, HTTPException, Query, Request
-from fastapi.responses import JSONResponse, RedirectResponse
-from fastapi_utils.tasks import repeat_every
+from fastapi import Body, Depends, FastAPI, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, RedirectResponse, Response
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from internal import crud, schemas
-from internal.config import EXPIRATION_CHECK_INTERVAL_MINUTES
-from internal.database import Base, engine, get_db
+from internal.config import AUTO_CREATE_SCHEMA, BULK_CREATE_MAX_KEYS, EXPIRATION_CHECK_INTERVAL_MINUTES
+from internal.database import Base, SessionLocal, engine, get_db
 from internal.models import KeyStatus
 
 
+logger = logging.getLogger(__name__)
+
+
+def expire_keys() -> None:
+    # SQLAlchemy sessions are synchronous, so the whole sweep runs in a worker thread.
+    # The session is closed afterwards so its connection returns to the pool.
+    with SessionLocal() as db:
+        crud.check_and_expire_keys(db)
+
+
+async def scheduled_expiration_check() -> None:
+    """
+    This task runs periodically to check for keys that need to be expired.
+    """
+    while True:
+        sweep = asyncio.ensure_future(run_in_threadpool(expire_keys))
+        try:
+            # Cancelling does not stop the worker thread, so shield the sweep and let an
+            # in-flight one finish before handing the cancellation on
+            await asyncio.shield(sweep)
+        except asyncio.CancelledError:
+            await asyncio.gather(sweep, return_exceptions=True)
+            raise
+        except Exception:
+            # A failed sweep must not end the schedule; the next one retries
+            logger.exception("Scheduled expiration check failed")
+        await asyncio.sleep(EXPIRATION_CHECK_INTERVAL_MINUTES * 60)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     This function manages the startup and periodic tasks in FastAPI.
     """
 
-    # Run the expiration check immediately on startup
-    db = next(get_db())
-    Base.metadata.create_all(bind=engine)
-    crud.check_and_expire_keys(db)
-
-    # Schedule the periodic task to run every hour
-    @repeat_every(seconds=EXPIRATION_CHECK_INTERVAL_MINUTES * 60)
-    async def scheduled_expiration_check() -> None:
-        """
-        This task runs periodically to check for keys that need to be expired.
-        """
-        db = next(get_db())
-        crud.check_and_expire_keys(db)
+    if AUTO_CREATE_SCHEMA:
+        Base.metadata.create_all(bind=engine)
+    # Open a pooled connection before serving, so the first request does not pay for
+    # connecting and the SQLite pragmas, and a bad DATABASE_URL fails at startup
+    with engine.connect():
+        pass
+
+    # Run the periodic expiration check as a task we hold on to, so shutdown can stop it
+    # before the pool is disposed. The first run starts right away, so keys are expired
+    # on startup without holding up readiness or the event loop.
+    expiration_task = asyncio.create_task(scheduled_expiration_check())
 
     # Yield to start the application
     yield
 
+    # Stop the periodic check first, so it cannot check out connections after the pool is closed
+    expiration_task.cancel()
+    try:
+        await expiration_task
+    except asyncio.CancelledError:
+        pass
+
+    # Close pooled connections on shutdown
+    engine.dispose()
+
 app = FastAPI(
     title="Crypto Key Inventory Management API",
     description=(
@@ -72,23 +112,55 @@ async def handle_integrity_error(request: Request, exc: IntegrityError) -> JSONR
         content={"detail": "Database integrity error. This may be due to duplicate or invalid data."}
     )
 
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison, so W/ tags added by proxies (e.g. on compression) still match
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def json_response(request: Request, content: bytes, headers: Optional[dict[str, str]] = None) -> Response:
+    """
+    Return JSON `content` with an ETag, or an empty 304 if the client already holds it.
+    """
+    etag = f'"{blake2b(content, digest_size=8).hexdigest()}"'
+    # Inventory data must not be kept by shared caches, and clients revalidate before reuse
+    headers = {**(headers or {}), "ETag": etag, "Cache-Control": "private, max-age=0, must-revalidate"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def next_cursor_header(result: Sequence[Any], limit: int, id_field: str, order_by: Optional[str]) -> dict[str, str]:
+    # A full page may have more rows after it; hand back the cursor for the next one.
+    # Cursors follow ULID order, so pages sorted by order_by have to use offset instead.
+    if order_by is None and result and len(result) == limit:
+        return {"X-Next-Cursor": getattr(result[-1], id_field)}
+    return {}
+
 # KeyType Operations
-@app.get("/key-types/", response_model=Sequence[schemas.KeyTypeSchema], summary="List KeyTypes")
+@app.get("/key-types/", response_model=None, responses={200: {"model": list[schemas.KeyTypeSchema]}},
+         summary="List KeyTypes")
 def get_key_types(
+    request: Request,
     skip: int = Query(0, alias="offset", ge=0, description="The number of records to skip."),
     limit: int = Query(10, le=100, description="The number of records to return, maximum 100."),
+    after: Optional[str] = Query(
+        None, description="Return records after this ID, as given in the X-Next-Cursor header."),
     order_by: Optional[str] = Query(
         None, description="Field to order by, prefix with - for descending."),
     name: Optional[str] = Query(None, description="Filter by name"),
     algorithm: Optional[str] = Query(None, description="Filter by algorithm"),
     size_bits: Optional[int] = Query(None, description="Filter by key size in bits"),
     db: Session = Depends(get_db),
-) -> Sequence[schemas.KeyTypeSchema]:
+) -> Response:
     """
     Get a list of KeyTypes with optional filtering, sorting, and pagination.
 
     - **offset**: The number of items to skip.
     - **limit**: The number of items to return.
+    - **after**: Cursor from the previous page's X-Next-Cursor header; cannot be combined with order_by.
     - **order_by**: Field to sort by, with "-" for descending order.
     - **name**: Filter by KeyType name.
     - **algorithm**: Filter by algorithm type.
@@ -107,13 +179,18 @@ def get_key_types(
         skip=skip,
         limit=limit,
         order_by=order_by,
-        filters=filters
+        filters=filters,
+        after=after
     )
 
-    return result
+    # Serialise straight to JSON bytes; the CRUD layer already returns schema instances,
+    # so FastAPI's response_model re-validation is skipped.
+    return json_response(request, schemas.KEY_TYPE_LIST_ADAPTER.dump_json(list(result), by_alias=True),
+                         headers=next_cursor_header(result, limit, "key_type_corr_id", order_by))
 
-@app.get("/key-types/{id}", response_model=schemas.KeyTypeSchema, summary="Get a KeyType by ID")
-def get_key_type(id: str, db: Session = Depends(get_db)) -> schemas.KeyTypeSchema:
+@app.get("/key-types/{id}", response_model=None, responses={200: {"model": schemas.KeyTypeSchema}},
+         summary="Get a KeyType by ID")
+def get_key_type(id: str, request: Request, db: Session = Depends(get_db)) -> Response:
     """
     Get a specific KeyType by its ID.
 
@@ -122,7 +199,7 @@ def get_key_type(id: str, db: Session = Depends(get_db)) -> schemas.KeyTypeSchem
     db_key_type = crud.get_key_type_by_ulid(db, key_type_id=id)
     if db_key_type is None:
         raise HTTPException(status_code=404, detail="KeyType not found")
-    return db_key_type
+    return json_response(request, db_key_type.model_dump_json(by_alias=True).encode())
 
 
 @app.post("/key-types/", response_model=schemas.KeyTypeSchema, summary="Create a new KeyType")
@@ -150,22 +227,27 @@ def delete_key_type(id: str,
     return crud.delete_key_type(db=db, key_type_id=id, force=force)
 
 # Key Operations
-@app.get("/keys/", response_model=Sequence[schemas.CryptoKeySchema], summary="List CryptoKeys")
+@app.get("/keys/", response_model=None, responses={200: {"model": list[schemas.CryptoKeySchema]}},
+         summary="List CryptoKeys")
 def get_crypto_keys(
+    request: Request,
     skip: int = Query(0, alias="offset", ge=0, description="The number of records to skip."),
     limit: int = Query(10, le=100, description="The number of records to return, maximum 100."),
+    after: Optional[str] = Query(
+        None, description="Return records after this ID, as given in the X-Next-Cursor header."),
     order_by: Optional[str] = Query(
         None, description="Field to order by, prefix with - for descending."),
     key_type_id: Optional[str] = Query(None, description="Filter by key type ID"),
     description: Optional[str] = Query(None, description="Filter by description"),
     generating_entity: Optional[str] = Query(None, description="Filter by generating entity"),
     db: Session = Depends(get_db),
-) -> Sequence[schemas.CryptoKeySchema]:
+) -> Response:
     """
     Get a list of CryptoKeys with optional filtering, sorting, and pagination.
 
     - **offset**: The number of items to skip.
     - **limit**: The number of items to return.
+    - **after**: Cursor from the previous page's X-Next-Cursor header; cannot be combined with order_by.
     - **order_by**: Field to sort by, with "-" for descending order.
     - **key_type_id**: Filter by KeyType ID.
     - **description**: Filter by description.
@@ -173,7 +255,7 @@ def get_crypto_keys(
     """
     filters: dict[str, Any] = {}
     if key_type_id is not None:
-        filters["key_type_id"] = key_type_id
+        filters["key_type_corr_id"] = key_type_id
     if description is not None:
         filters["description"] = description
     if generating_entity is not None:
@@ -184,13 +266,16 @@ def get_crypto_keys(
         skip=skip,
         limit=limit,
         order_by=order_by,
-        filters=filters
+        filters=filters,
+        after=after
     )
 
-    return result
+    return json_response(request, schemas.CRYPTO_KEY_LIST_ADAPTER.dump_json(list(result), by_alias=True),
+                         headers=next_cursor_header(result, limit, "key_corr_id", order_by))
 
-@app.get("/keys/{id}", response_model=schemas.CryptoKeySchema, summary="Get a CryptoKey by ID")
-def get_crypto_key(id: str, db: Session = Depends(get_db)) -> schemas.CryptoKeySchema:
+@app.get("/keys/{id}", response_model=None, responses={200: {"model": schemas.CryptoKeySchema}},
+         summary="Get a CryptoKey by ID")
+def get_crypto_key(id: str, request: Request, db: Session = Depends(get_db)) -> Response:
     """
     Get a specific CryptoKey by its id.
 
@@ -199,7 +284,7 @@ def get_crypto_key(id: str, db: Session = Depends(get_db)) -> schemas.CryptoKeyS
     db_crypto_key: Optional[schemas.CryptoKeySchema] = crud.get_crypto_key_by_id(db, id)
     if db_crypto_key is None:
         raise HTTPException(status_code=404, detail="CryptoKey not found")
-    return db_crypto_key
+    return json_response(request, db_crypto_key.model_dump_json(by_alias=True).encode())
 
 @app.post("/keys/", response_model=schemas.CryptoKeyCreateSchema, summary="Create a new CryptoKey")
 def create_crypto_key(crypto_key: schemas.CryptoKeyCreateSchema, db: Session = Depends(get_db)) -> schemas.CryptoKeySchema:
@@ -209,11 +294,23 @@ def create_crypto_key(crypto_key: schemas.CryptoKeyCreateSchema, db: Session = D
 
     - **crypto_key**: Details of the CryptoKey to create.
     """
-    db_key_type = crud.get_key_type_by_id(
-        db, key_type_id=crypto_key.key_type_corr_id)
-    if not db_key_type:
-        raise HTTPException(status_code=400, detail="Invalid key_type_id")
-    return crud.create_crypto_key(db=db, crypto_key=crypto_key, key_type=db_key_type)
+    return crud.create_crypto_key(db=db, crypto_key=crypto_key)
+
+@app.post("/keys/bulk", response_model=None, responses={200: {"model": list[schemas.CryptoKeySchema]}},
+          summary="Create many CryptoKeys")
+def create_crypto_keys_bulk(
+    crypto_keys: Annotated[list[schemas.CryptoKeyCreateSchema], Body(max_length=BULK_CREATE_MAX_KEYS)],
+    db: Session = Depends(get_db),
+) -> Response:
+    """
+    Create many CryptoKeys in one transaction. Either all keys are created or none are.
+    Status: Active (Used to encrypt and decrypt data.)
+
+    - **crypto_keys**: Details of the CryptoKeys to create, at most BULK_CREATE_MAX_KEYS per request.
+    """
+    result = crud.create_crypto_keys_bulk(db=db, crypto_keys=crypto_keys)
+    return Response(content=schemas.CRYPTO_KEY_LIST_ADAPTER.dump_json(result, by_alias=True),
+                    media_type="application/json")
 
 @app.post("/keys/{id}/suspend", summary="Suspend a CryptoKey")
 def suspend_key(id: str, justification: str, db: Session = Depends(get_db)) -> crud.CryptoKeySchema:
@@ -246,15 +343,16 @@ def destroy_key(id: str, justification: str, db: Session = Depends(get_db)) -> c
     return crud.update_key_status(db, id, KeyStatus.DESTROYED, justification)
 
 # Key History Operations
-@app.get("/keys/{id}/history", response_model=list[schemas.KeyHistorySchema], summary="Get CryptoKey history")
-def get_key_history(id: str, db: Session = Depends(get_db)) -> list[schemas.CryptoKeySchema]:
+@app.get("/keys/{id}/history", response_model=None, responses={200: {"model": list[schemas.KeyHistorySchema]}},
+         summary="Get CryptoKey history")
+def get_key_history(id: str, request: Request, db: Session = Depends(get_db)) -> Response:
     """
     Get the history of state changes for a specific CryptoKey.
 
     - **id**: The ID of the CryptoKey whose history to retrieve.
     """
-    history: list[schemas.CryptoKeySchema] = crud.get_key_history(db, id)
+    history: list[schemas.KeyHistorySchema] = crud.get_key_history(db, id)
     if not history:
         raise HTTPException(
             status_code=404, detail="No history found for this key")
-    return history
+    return json_response(request, schemas.KEY_HISTORY_LIST_ADAPTER.dump_json(history, by_alias=True))
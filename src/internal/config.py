@@ -1,3 +1,21 @@
 DATABASE_URL = "sqlite:///./crypto_inventory.db"
+# Connection pool sizing; keep workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) within the server's connection limit
+DB_POOL_SIZE = 50
+DB_MAX_OVERFLOW = 50
+# Seconds a request waits for a free pooled connection before failing
+DB_POOL_TIMEOUT_SECONDS = 30
+DB_POOL_RECYCLE_SECONDS = 1800
+# Number of compiled SQL statements SQLAlchemy keeps per engine
+DB_QUERY_CACHE_SIZE = 1200
+# Rows per multi-VALUES INSERT when executing many rows; 1000 CryptoKey rows stay under SQLite's 32766 parameter limit
+DB_INSERTMANYVALUES_PAGE_SIZE = 1000
+# Create missing tables on startup; disable when the schema is managed by migrations
+AUTO_CREATE_SCHEMA = True
+# Most CryptoKeys accepted by one POST /keys/bulk request, which is a single write transaction
+BULK_CREATE_MAX_KEYS = 1000
 EXPIRATION_CHECK_INTERVAL_MINUTES = 60
+# KeyType cryptoperiods cached per process for key creation; 0 disables the cache
+KEY_TYPE_CACHE_SIZE = 256
 MAX_EXPIRY_DAYS = 365 * 100  # Arbitrary business rule, e.g., 100 years
+# Raise on lazy relationship loads instead of silently issuing one query per row
+STRICT_LOADING = True
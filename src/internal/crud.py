@@ -1,80 +1,258 @@
 # crud.py
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from sqlite3 import IntegrityError
-from typing import Optional, Sequence, Type
+from enum import Enum
+from functools import lru_cache
+from itertools import islice
+from threading import Lock
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence, Type, TypeVar
 
 from fastapi import HTTPException
-from sqlalchemy import asc, desc
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, asc, bindparam, desc, insert, inspect, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session, raiseload
+
+from .config import KEY_TYPE_CACHE_SIZE, STRICT_LOADING
+from .models import ALLOWED_TRANSITION_PAIRS, CryptoKey, KeyStatus, KeyType, KeyTypeStatus
+from .schemas import (CRYPTO_KEY_LIST_ADAPTER, CryptoKeyCreateSchema, CryptoKeySchema, KeyHistorySchema,
+                      KeyTypeCreateSchema, KeyTypeDeleteSchema, KeyTypeSchema)
+from .utils import format_cryptoperiod, parse_cryptoperiod_unchecked
+
+_UTC = timezone.utc
+
+# Loader options for queries that return ORM entities; see config.STRICT_LOADING
+_LOADER_OPTIONS = (raiseload("*"),) if STRICT_LOADING else ()
+
+SchemaT = TypeVar("SchemaT", KeyTypeSchema, CryptoKeySchema, KeyHistorySchema)
+
+# Filterable/sortable columns per model, resolved once instead of via hasattr/getattr per request
+_COLUMN_ATTRS: dict[type, dict[str, Any]] = {
+    model: {attr.key: attr.class_attribute for attr in inspect(model).column_attrs}
+    for model in (KeyType, CryptoKey)
+}
+_FILTERABLE: dict[type, frozenset[str]] = {
+    model: frozenset(columns) for model, columns in _COLUMN_ATTRS.items()
+}
+
+# Order clause for every accepted order_by value, e.g. "name" and "-name"
+_ORDER_CLAUSES: dict[type, dict[str, Any]] = {
+    model: {
+        f"{prefix}{name}": order_func(column)
+        for name, column in columns.items()
+        for prefix, order_func in (("", asc), ("-", desc))
+    }
+    for model, columns in _COLUMN_ATTRS.items()
+}
+
+# Single-row lookups, built once with bound parameters so they compile once
+_ACTIVE_KEY_TYPE_BY_ID = (
+    select(KeyType)
+    .where(KeyType.key_type_corr_id == bindparam("key_type_id"), KeyType.status == KeyTypeStatus.ACTIVE)
+    .limit(1)
+    .options(*_LOADER_OPTIONS)
+)
+_KEY_TYPE_CRYPTOPERIOD_DAYS = (
+    select(KeyType.cryptoperiod_days)
+    .where(KeyType.key_type_corr_id == bindparam("key_type_id"), KeyType.status == KeyTypeStatus.ACTIVE)
+)
+_LATEST_KEY_VERSION = (
+    select(CryptoKey)
+    .where(CryptoKey.key_corr_id == bindparam("key_id"))
+    .order_by(CryptoKey.timestamp.desc())
+    .limit(1)
+    .options(*_LOADER_OPTIONS)
+)
+
+# Set-based expiration sweep, served by ix_crypto_keys_status_expiration_date
+_EXPIRE_KEYS = (
+    update(CryptoKey)
+    .where(
+        CryptoKey.status.in_([KeyStatus.ACTIVE, KeyStatus.SUSPENDED]),
+        CryptoKey.expiration_date <= bindparam("now")
+    )
+    .values(status=KeyStatus.EXPIRED, justification="Automatically expired due to expiration date")
+)
+
+# Keyset pagination column per model. ULIDs sort in creation order and are unique-indexed.
+_CURSOR_COLUMNS: dict[type, Any] = {
+    KeyType: KeyType.key_type_corr_id,
+    CryptoKey: CryptoKey.key_corr_id,
+}
+
+# KeyType id -> cryptoperiod_days, see get_key_type_cryptoperiod_days
+# Bounded LRU guarded by a lock, since sync routes run on the threadpool
+_cryptoperiod_cache: OrderedDict[str, int] = OrderedDict()
+_cryptoperiod_cache_lock = Lock()
+
+# Columns copied from the previous version of a CryptoKey when its status changes.
+# key_corr_id is unique, so each version keeps receiving a fresh ULID from the column default.
+_VERSIONED_COLUMNS: tuple[str, ...] = tuple(
+    column for column in _COLUMN_ATTRS[CryptoKey] if column not in {"id", "key_corr_id", "status", "timestamp"}
+)
+
+# Field names of the response schemas, computed once instead of per row
+_SCHEMA_FIELDS: dict[type, tuple[str, ...]] = {
+    KeyTypeSchema: tuple(KeyTypeSchema.model_fields),
+    CryptoKeySchema: tuple(CryptoKeySchema.model_fields),
+    KeyHistorySchema: tuple(KeyHistorySchema.model_fields),
+}
+
+# Columns selected for list reads, labelled with the schema field they populate.
+# KeyTypeSchema.cryptoperiod is derived from the stored cryptoperiod_days.
+_SCHEMA_COLUMNS: dict[type, tuple[Any, ...]] = {
+    KeyTypeSchema: tuple(
+        KeyType.cryptoperiod_days.label("cryptoperiod") if field == "cryptoperiod"
+        else _COLUMN_ATTRS[KeyType][field]
+        for field in _SCHEMA_FIELDS[KeyTypeSchema]
+    ),
+    CryptoKeySchema: tuple(_COLUMN_ATTRS[CryptoKey][field] for field in _SCHEMA_FIELDS[CryptoKeySchema]),
+    # KeyHistorySchema.id is the key_corr_id
+    KeyHistorySchema: tuple(
+        CryptoKey.key_corr_id.label("id") if field == "id"
+        else _COLUMN_ATTRS[CryptoKey][field]
+        for field in _SCHEMA_FIELDS[KeyHistorySchema]
+    ),
+}
+_FIELD_CONVERTERS: dict[type, dict[str, Callable[[Any], Any]]] = {
+    KeyTypeSchema: {"cryptoperiod": format_cryptoperiod},
+    CryptoKeySchema: {},
+    KeyHistorySchema: {},
+}
+
+# Single-item reads select just the response columns, like the list reads
+_KEY_TYPE_ROW_BY_ID = (
+    select(*_SCHEMA_COLUMNS[KeyTypeSchema]).where(KeyType.key_type_corr_id == bindparam("key_type_id")).limit(1)
+)
+_CRYPTO_KEY_ROW_BY_ID = (
+    select(*_SCHEMA_COLUMNS[CryptoKeySchema]).where(CryptoKey.key_corr_id == bindparam("key_id")).limit(1)
+)
+
+
+def schema_from_row(cls: Type[SchemaT], row: Mapping[str, Any]) -> SchemaT:
+    """
+    Build a response schema from a trusted row selected with `_SCHEMA_COLUMNS[cls]`.
 
-from .models import ALLOWED_TRANSITIONS, CryptoKey, KeyStatus, KeyType, KeyTypeStatus
-from .schemas import CryptoKeyCreateSchema, CryptoKeySchema, KeyTypeCreateSchema, KeyTypeDeleteSchema, KeyTypeSchema
-from .utils import format_cryptoperiod, parse_cryptoperiod
+    Rows read back from the database were validated on the way in, so
+    `model_construct` is used instead of `model_validate`. Enum members are
+    stored by value to match the `use_enum_values` behaviour of the schemas.
+    """
+    converters = _FIELD_CONVERTERS[cls]
+    data: dict[str, Any] = {}
+    for field, value in row.items():
+        if field in converters:
+            value = converters[field](value)
+        data[field] = value.value if isinstance(value, Enum) else value
+    return cls.model_construct(**data)
+
+
+@lru_cache(maxsize=256)
+def _validate_filter_shape(
+    model: Type, fields: tuple[str, ...], order_by: Optional[str]
+) -> tuple[tuple[Any, ...], Optional[Any]]:
+    """
+    Resolve the filter columns and order clause for a request shape, or raise 400.
 
+    List requests repeat the same few shapes, so the result is memoised.
+    """
+    allowed = _FILTERABLE[model]
+    columns = _COLUMN_ATTRS[model]
 
-def apply_filters_and_sorting(
-    query, model: Type, filters: Optional[dict] = None, order_by: Optional[str] = None
-):
-    # Apply filters
-    if filters:
-        for field, value in filters.items():
-            if hasattr(model, field):
-                query = query.filter(getattr(model, field) == value)
-            else:
-                raise HTTPException(
-                    status_code=400, detail=f"Invalid filter field: {field}")
+    for field in fields:
+        if field not in allowed:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid filter field: {field}")
 
-    # Apply sorting
+    order_clause = None
     if order_by:
-        field_name = order_by.lstrip("-")
-        if not hasattr(model, field_name):
+        order_clause = _ORDER_CLAUSES[model].get(order_by)
+        if order_clause is None:
             raise HTTPException(
-                status_code=400, detail=f"Invalid order_by field: {field_name}")
+                status_code=400, detail=f"Invalid order_by field: {order_by.lstrip('-')}")
 
-        order_func = desc if order_by.startswith("-") else asc
-        query = query.order_by(order_func(getattr(model, field_name)))
+    return tuple(columns[field] for field in fields), order_clause
 
-    return query
 
+def apply_filters_and_sorting(
+    stmt: Select, model: Type, filters: Optional[dict] = None, order_by: Optional[str] = None
+) -> Select:
+    filter_columns, order_clause = _validate_filter_shape(
+        model, tuple(filters) if filters else (), order_by)
 
-def get_key_types(
+    # Apply all filters in one WHERE rather than cloning the statement per filter
+    if filters:
+        stmt = stmt.where(*(column == value for column, value in zip(filter_columns, filters.values())))
+
+    # Apply sorting
+    if order_clause is not None:
+        stmt = stmt.order_by(order_clause)
+
+    return stmt
+
+
+def paginate(
     db: Session,
+    schema: Type[SchemaT],
+    model: Type,
     skip: int = 0,
     limit: int = 10,
     order_by: Optional[str] = None,
-    filters: Optional[dict] = None
-) -> Sequence[KeyTypeSchema]:
-    query = db.query(KeyType)
-    query = apply_filters_and_sorting(query, KeyType, filters, order_by)
-    query = query.offset(skip).limit(limit)
+    filters: Optional[dict] = None,
+    after: Optional[str] = None
+) -> list[SchemaT]:
+    """
+    Return one page of `model` rows as `schema` instances, filtered and sorted.
+
+    Without `order_by`, rows are ordered by their ULID. Passing the last ULID of
+    a page as `after` then fetches the next page through the unique index,
+    without the cost of scanning and discarding `skip` rows.
+    """
+    cursor_column = _CURSOR_COLUMNS[model]
+    if after is not None and order_by:
+        raise HTTPException(
+            status_code=400, detail="after cannot be combined with order_by.")
+
+    stmt = select(*_SCHEMA_COLUMNS[schema])
+    stmt = apply_filters_and_sorting(stmt, model, filters, order_by)
+    if after is not None:
+        stmt = stmt.where(cursor_column > after)
+    if not order_by:
+        stmt = stmt.order_by(cursor_column)
+    # Fetch in batches so only one batch of raw rows is held alongside the schemas
+    stmt = stmt.offset(skip).limit(limit).execution_options(yield_per=256)
 
     try:
-        db_key_types = query.all()
-        return [KeyTypeSchema.model_validate(db_key_type) for db_key_type in db_key_types]
+        rows = db.execute(stmt).mappings()
+        return [schema_from_row(schema, row) for row in rows]
     except SQLAlchemyError:
         raise HTTPException(
-            status_code=500, detail="Database error while retrieving key types.")
+            status_code=500, detail=f"Database error while retrieving {model.__tablename__.replace('_', ' ')}.")
+
+
+def get_key_types(
+    db: Session,
+    skip: int = 0,
+    limit: int = 10,
+    order_by: Optional[str] = None,
+    filters: Optional[dict] = None,
+    after: Optional[str] = None
+) -> Sequence[KeyTypeSchema]:
+    return paginate(db, KeyTypeSchema, KeyType, skip, limit, order_by, filters, after)
 
 def get_key_type_by_id(db: Session, key_type_id: str) -> Optional[KeyTypeSchema]:
-    # Retrieve a single KeyType model from the database
-    db_key_type = db.query(KeyType).filter(KeyType.key_type_corr_id == key_type_id).first()
-    # Convert to KeyTypeSchema if the model exists
-    return KeyTypeSchema.model_validate(db_key_type) if db_key_type else None
+    row = db.execute(_KEY_TYPE_ROW_BY_ID, {"key_type_id": key_type_id}).mappings().one_or_none()
+    # Trusted database row: construct without validation. Request bodies still go through model_validate.
+    return schema_from_row(KeyTypeSchema, row) if row else None
 
 
-def get_key_type_by_ulid(db: Session, key_type_id: str) -> Optional[KeyTypeSchema]:
-    # Retrieve a single KeyType model from the database
-    db_key_type = db.query(KeyType).filter(
-        KeyType.key_type_corr_id == key_type_id).first()
-    # Convert to KeyTypeSchema if the model exists
-    return KeyTypeSchema.model_validate(db_key_type) if db_key_type else None
+# KeyType ids are ULIDs, so both names resolve the same lookup
+get_key_type_by_ulid = get_key_type_by_id
 
 def create_key_type(db: Session, key_type: KeyTypeCreateSchema) -> KeyTypeSchema:
     try:
-        cryptoperiod_days = parse_cryptoperiod(key_type.cryptoperiod)
+        cryptoperiod_days = parse_cryptoperiod_unchecked(key_type.cryptoperiod)
 
-        db_key_type = KeyType(
+        # INSERT ... RETURNING populates the row without a refresh SELECT
+        db_key_type = db.execute(insert(KeyType).values(
             name=key_type.name,
             description=key_type.description,
             algorithm=key_type.algorithm,
@@ -83,11 +261,10 @@ def create_key_type(db: Session, key_type: KeyTypeCreateSchema) -> KeyTypeSchema
             form_factor=key_type.form_factor,
             uniqueness_scope=key_type.uniqueness_scope,
             cryptoperiod_days=cryptoperiod_days
-        )
-        db.add(db_key_type)
+        ).returning(KeyType)).scalar_one()
+        result = KeyTypeSchema.model_validate(db_key_type)
         db.commit()
-        db.refresh(db_key_type)
-        return KeyTypeSchema.model_validate(db_key_type)
+        return result
     except IntegrityError as e:
         db.rollback()
         raise HTTPException(
@@ -99,16 +276,19 @@ def create_key_type(db: Session, key_type: KeyTypeCreateSchema) -> KeyTypeSchema
 
 
 def delete_key_type(db: Session, key_type_id: str, force: bool = False) -> KeyTypeDeleteSchema:
-    key_type = db.query(KeyType).filter(
-        KeyType.key_type_corr_id == key_type_id, KeyType.status == KeyTypeStatus.ACTIVE).first()
+    key_type = db.scalars(_ACTIVE_KEY_TYPE_BY_ID, {"key_type_id": key_type_id}).one_or_none()
     if not key_type:
         raise HTTPException(
             status_code=404, detail="KeyType not found or already disabled.")
 
-    associated_keys_count = db.query(CryptoKey).filter(
-        CryptoKey.key_type_corr_id == key_type.key_type_corr_id, CryptoKey.status != KeyStatus.DESTROYED).count()
+    # Only existence matters, so let the database stop at the first matching key
+    has_associated_keys = db.query(
+        db.query(CryptoKey).filter(
+            CryptoKey.key_type_corr_id == key_type.key_type_corr_id, CryptoKey.status != KeyStatus.DESTROYED
+        ).exists()
+    ).scalar()
 
-    if associated_keys_count > 0:
+    if has_associated_keys:
         if not force:
             raise HTTPException(
                 status_code=400,
@@ -116,10 +296,10 @@ def delete_key_type(db: Session, key_type_id: str, force: bool = False) -> KeyTy
             )
         else:
             try:
+                # Disable the KeyType and destroy its keys in one transaction
                 key_type.status = KeyTypeStatus.DISABLED
-                db.commit()
                 db.query(CryptoKey).filter(CryptoKey.key_type_corr_id == key_type.key_type_corr_id).update(
-                    {"status": KeyStatus.DESTROYED}
+                    {"status": KeyStatus.DESTROYED}, synchronize_session=False
                 )
                 db.commit()
             except SQLAlchemyError as e:
@@ -135,7 +315,12 @@ def delete_key_type(db: Session, key_type_id: str, force: bool = False) -> KeyTy
             raise HTTPException(
                 status_code=500, detail=f"Error deleting KeyType: {str(e)}")
 
-    return KeyTypeDeleteSchema(key_type_corr_id=key_type.key_type_corr_id, status=key_type.status) # type: ignore
+    # The KeyType is disabled now, so new keys must no longer resolve its cached cryptoperiod
+    with _cryptoperiod_cache_lock:
+        _cryptoperiod_cache.pop(key_type_id, None)
+
+    # Every successful path leaves the KeyType disabled, and both values are trusted
+    return KeyTypeDeleteSchema.model_construct(key_type_corr_id=key_type_id, status=KeyTypeStatus.DISABLED.value)
 
 
 def get_crypto_keys(
@@ -143,108 +328,130 @@ def get_crypto_keys(
     skip: int = 0,
     limit: int = 10,
     order_by: Optional[str] = None,
-    filters: Optional[dict] = None
+    filters: Optional[dict] = None,
+    after: Optional[str] = None
 ) -> Sequence[CryptoKeySchema]:
-    query = db.query(CryptoKey)
-    query = apply_filters_and_sorting(query, CryptoKey, filters, order_by)
-    query = query.offset(skip).limit(limit)
-
-    try:
-        db_crypto_keys = query.all()
-        return [CryptoKeySchema.model_validate(db_crypto_key) for db_crypto_key in db_crypto_keys]
-    except SQLAlchemyError:
-        raise HTTPException(
-            status_code=500, detail="Database error while retrieving crypto keys.")
+    return paginate(db, CryptoKeySchema, CryptoKey, skip, limit, order_by, filters, after)
 
 def get_crypto_key_by_id(db: Session, key_id: str) -> Optional[CryptoKeySchema]:
-    # Retrieve a single CryptoKey model from the database
-    db_crypto_key = db.query(CryptoKey).filter(CryptoKey.key_corr_id == key_id).first()
-    # Convert to CryptoKeySchema if the model exists
-    return CryptoKeySchema.model_validate(db_crypto_key, strict=True, from_attributes=True) if db_crypto_key else None
-
+    row = db.execute(_CRYPTO_KEY_ROW_BY_ID, {"key_id": key_id}).mappings().one_or_none()
+    # Trusted database row: construct without validation. Request bodies still go through model_validate.
+    return schema_from_row(CryptoKeySchema, row) if row else None
 
-def create_crypto_key(db: Session, crypto_key: CryptoKeyCreateSchema, key_type: KeyTypeSchema) -> CryptoKeySchema:
-    # Create a new CryptoKey model using input from the CryptoKeyCreate schema
-    db_crypto_key = CryptoKey(**crypto_key.model_dump())
 
+def _crypto_key_values(crypto_key: CryptoKeyCreateSchema, cryptoperiod_days: int) -> dict[str, Any]:
     # Calculate expiration date and intended lifetime based on KeyType's cryptoperiod
-    activation_date = crypto_key.activation_date or datetime.now(timezone.utc)
-
-    # Assuming cryptoperiod is stored as days in the KeyType
-    cryptoperiod_days = parse_cryptoperiod(key_type.cryptoperiod)
+    activation_date = crypto_key.activation_date or datetime.now(_UTC)
     expiration_date = activation_date + timedelta(days=cryptoperiod_days)
+
+    # Dump the validated input once and fill in the computed fields
+    data = crypto_key.model_dump()
     # Convert days to a readable format for lifetime
-    intended_lifetime = format_cryptoperiod(cryptoperiod_days)
-
-    db_crypto_key = CryptoKey(
-        key_type_corr_id=key_type.key_type_corr_id,
-        description=crypto_key.description,
-        generating_entity=crypto_key.generating_entity,
-        generation_method=crypto_key.generation_method,
-        storage_location=crypto_key.storage_location,
-        encryption_under_lmk=crypto_key.encryption_under_lmk,
-        form_factor=crypto_key.form_factor,
-        scope_of_uniqueness=crypto_key.scope_of_uniqueness,
-        usage_purpose=crypto_key.usage_purpose,
-        operational_environment=crypto_key.operational_environment,
-        associated_parties=crypto_key.associated_parties,
-        intended_lifetime=intended_lifetime,
-        activation_date=activation_date,
-        expiration_date=expiration_date,
-        status=KeyStatus.ACTIVE,  # Default status on creation
-        access_control_mechanisms=crypto_key.access_control_mechanisms,
-        compliance_requirements=crypto_key.compliance_requirements,
-        audit_log_reference=crypto_key.audit_log_reference,
-        backup_and_recovery_details=crypto_key.backup_and_recovery_details,
-        notes=crypto_key.notes,
-        justification=crypto_key.usage_purpose
-    )
+    data["intended_lifetime"] = format_cryptoperiod(cryptoperiod_days)
+    data["activation_date"] = activation_date
+    data["expiration_date"] = expiration_date
+    data["status"] = KeyStatus.ACTIVE  # Default status on creation
+    data["justification"] = crypto_key.usage_purpose
+    return data
+
+
+def get_key_type_cryptoperiod_days(db: Session, key_type_id: str) -> Optional[int]:
+    """
+    Return the cryptoperiod in days of an active KeyType, or None if it does not exist or is disabled.
+
+    A KeyType's cryptoperiod never changes after creation, so results are cached
+    in-process, up to KEY_TYPE_CACHE_SIZE entries. Unknown and disabled ids are not
+    cached, and delete_key_type evicts a KeyType once it is disabled.
+    """
+    with _cryptoperiod_cache_lock:
+        cryptoperiod_days = _cryptoperiod_cache.get(key_type_id)
+        if cryptoperiod_days is not None:
+            _cryptoperiod_cache.move_to_end(key_type_id)
+            return cryptoperiod_days
+
+    # Only the cryptoperiod of the KeyType is needed, so fetch that column alone
+    cryptoperiod_days = db.execute(
+        _KEY_TYPE_CRYPTOPERIOD_DAYS, {"key_type_id": key_type_id}).scalar_one_or_none()
+    if cryptoperiod_days is not None and KEY_TYPE_CACHE_SIZE > 0:
+        with _cryptoperiod_cache_lock:
+            _cryptoperiod_cache[key_type_id] = cryptoperiod_days
+            if len(_cryptoperiod_cache) > KEY_TYPE_CACHE_SIZE:
+                _cryptoperiod_cache.popitem(last=False)
+    return cryptoperiod_days
+
+
+def create_crypto_key(db: Session, crypto_key: CryptoKeyCreateSchema) -> CryptoKeySchema:
+    cryptoperiod_days = get_key_type_cryptoperiod_days(db, crypto_key.key_type_corr_id)
+    if cryptoperiod_days is None:
+        raise HTTPException(status_code=400, detail="Invalid key_type_id")
+
+    stmt = insert(CryptoKey).values(**_crypto_key_values(crypto_key, cryptoperiod_days)).returning(CryptoKey)
 
     try:
-        # Add and commit the new CryptoKey to the database
-        db.add(db_crypto_key)
+        # Insert the new CryptoKey, reading it back through RETURNING, and commit
+        db_crypto_key = db.execute(stmt).scalar_one()
+        result = CryptoKeySchema.model_validate(db_crypto_key)
         db.commit()
-        db.refresh(db_crypto_key)
-        return CryptoKeySchema.model_validate(db_crypto_key)
+        return result
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create crypto key: {str(e)}")
 
+
+def create_crypto_keys_bulk(
+    db: Session,
+    crypto_keys: Iterable[CryptoKeyCreateSchema],
+    batch_size: int = 1000
+) -> list[CryptoKeySchema]:
+    """
+    Create many CryptoKeys in one transaction using multi-row INSERT statements.
+
+    Rows are inserted in batches of `batch_size`, so a large import never builds a
+    single oversized statement. Either all keys are created or none are.
+    """
+    crypto_keys = list(crypto_keys)
+
+    # Resolve the cryptoperiod of every referenced KeyType with one query; disabled ones count as missing
+    key_type_ids = {crypto_key.key_type_corr_id for crypto_key in crypto_keys}
+    cryptoperiods: dict[str, int] = dict(db.execute(
+        select(KeyType.key_type_corr_id, KeyType.cryptoperiod_days)
+        .where(KeyType.key_type_corr_id.in_(key_type_ids), KeyType.status == KeyTypeStatus.ACTIVE)
+    ).tuples().all())
+    missing = key_type_ids - cryptoperiods.keys()
+    if missing:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid key_type_id: {', '.join(sorted(missing))}")
+
+    stmt = insert(CryptoKey).returning(CryptoKey, sort_by_parameter_order=True)
+    values = (
+        _crypto_key_values(crypto_key, cryptoperiods[crypto_key.key_type_corr_id])
+        for crypto_key in crypto_keys
+    )
+    results: list[CryptoKeySchema] = []
+    try:
+        while batch := list(islice(values, batch_size)):
+            results.extend(CRYPTO_KEY_LIST_ADAPTER.validate_python(
+                db.scalars(stmt, batch).all(), from_attributes=True))
+        db.commit()
+        return results
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to create crypto keys: {str(e)}")
+
 def create_key_version(
     db: Session,
     original_key: CryptoKey,
     new_status: KeyStatus
 ) -> CryptoKeySchema:
     # Create a new version of the CryptoKey record
-    new_key_version = CryptoKey(
-        key_type_corr_id=original_key.key_type_corr_id,
-        description=original_key.description,
-        generating_entity=original_key.generating_entity,
-        generation_method=original_key.generation_method,
-        storage_location=original_key.storage_location,
-        encryption_under_lmk=original_key.encryption_under_lmk,
-        form_factor=original_key.form_factor,
-        scope_of_uniqueness=original_key.scope_of_uniqueness,
-        usage_purpose=original_key.usage_purpose,
-        operational_environment=original_key.operational_environment,
-        associated_parties=original_key.associated_parties,
-        intended_lifetime=original_key.intended_lifetime,
-        status=new_status,
-        expiration_date=original_key.expiration_date,
-        access_control_mechanisms=original_key.access_control_mechanisms,
-        compliance_requirements=original_key.compliance_requirements,
-        audit_log_reference=original_key.audit_log_reference,
-        backup_and_recovery_details=original_key.backup_and_recovery_details,
-        notes=original_key.notes,
-        activation_date=original_key.activation_date,
-        timestamp=datetime.now(timezone.utc),
-        justification=original_key.justification
-    )
+    data = {column: getattr(original_key, column) for column in _VERSIONED_COLUMNS}
+    data["status"] = new_status
+    data["timestamp"] = datetime.now(_UTC)
     try:
-        db.add(new_key_version)
+        new_key_version = db.execute(insert(CryptoKey).values(**data).returning(CryptoKey)).scalar_one()
+        result = CryptoKeySchema.model_validate(new_key_version)
         db.commit()
-        db.refresh(new_key_version)
-        return CryptoKeySchema.model_validate(new_key_version)
+        return result
     except SQLAlchemyError:
         db.rollback()
         raise HTTPException(
@@ -255,16 +462,18 @@ def is_transition_valid(current_status: KeyStatus, new_status: KeyStatus) -> boo
     """
     Check if the transition from current_status to new_status is valid.
     """
-    return new_status in ALLOWED_TRANSITIONS[current_status]
+    return (current_status, new_status) in ALLOWED_TRANSITION_PAIRS
+
+def get_latest_key_version(db: Session, key_id: str) -> Optional[CryptoKey]:
+    """
+    Return the most recent record of a CryptoKey, or None if it does not exist.
+    """
+    return db.scalars(_LATEST_KEY_VERSION, {"key_id": key_id}).one_or_none()
+
 
 def update_key_status(db: Session, key_id: str, new_status: KeyStatus, justification: str) -> CryptoKeySchema:
     # Find the latest record of the key
-    original_key = (
-        db.query(CryptoKey)
-        .filter(CryptoKey.key_corr_id == key_id)
-        .order_by(CryptoKey.timestamp.desc())
-        .first()
-    )
+    original_key = get_latest_key_version(db, key_id)
     if not original_key:
         raise HTTPException(status_code=404, detail="Key not found")
 
@@ -289,28 +498,22 @@ def check_and_expire_keys(db: Session) -> None:
     Checks for CryptoKeys with an expiration date in the past and marks them as expired.
     """
     # Get the current date and time
-    now = datetime.now(timezone.utc)
-
-    # Query all active or suspended keys with expiration dates in the past
-    keys_to_expire = db.query(CryptoKey).filter(
-        (CryptoKey.status.in_([KeyStatus.ACTIVE, KeyStatus.SUSPENDED])) &
-        (CryptoKey.expiration_date <= now)
-    ).all()
-
-    for key in keys_to_expire:
-        key.status = KeyStatus.EXPIRED
-        key.justification = "Automatically expired due to expiration date"
+    now = datetime.now(_UTC)
 
+    # Expire all active or suspended keys with expiration dates in the past in a single UPDATE
+    db.execute(
+        _EXPIRE_KEYS, {"now": now}, execution_options={"synchronize_session": False})
 
     # Commit the status updates to the database
     db.commit()
 
 
-def get_key_history(db: Session, key_id: str) -> list[CryptoKeySchema]:
-    history = (
-        db.query(CryptoKey)
-        .filter(CryptoKey.key_corr_id == key_id)
+def get_key_history(db: Session, key_id: str) -> list[KeyHistorySchema]:
+    # Only the history columns are read, in batches, rather than whole CryptoKey rows
+    stmt = (
+        select(*_SCHEMA_COLUMNS[KeyHistorySchema])
+        .where(CryptoKey.key_corr_id == key_id)
         .order_by(CryptoKey.timestamp)
-        .all()
+        .execution_options(yield_per=200)
     )
-    return [CryptoKeySchema.model_validate(record) for record in history]
+    return [schema_from_row(KeyHistorySchema, row) for row in db.execute(stmt).mappings()]
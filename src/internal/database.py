@@ -1,11 +1,43 @@
 # database.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-from .config import DATABASE_URL
+from .config import (DATABASE_URL, DB_INSERTMANYVALUES_PAGE_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE_SECONDS,
+                     DB_POOL_SIZE, DB_POOL_TIMEOUT_SECONDS, DB_QUERY_CACHE_SIZE)
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE_SECONDS,
+    query_cache_size=DB_QUERY_CACHE_SIZE,
+    use_insertmanyvalues=True,
+    insertmanyvalues_page_size=DB_INSERTMANYVALUES_PAGE_SIZE,
+)
+# Objects are not expired on commit, so building a response after commit does not re-SELECT them
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Tune each new SQLite connection once, when the pool opens it.
+
+    WAL lets readers run alongside the periodic expiration sweep, and
+    synchronous=NORMAL is safe in WAL mode while avoiding an fsync per commit.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
 
 Base = declarative_base()
 
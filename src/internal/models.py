@@ -5,10 +5,21 @@
 import ulid
 from sqlalchemy import Column, DateTime
 from sqlalchemy import Enum as SQLAlchemyEnum
-from sqlalchemy import ForeignKey, Integer, String
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy import ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, configure_mappers, relationship
 
 from .database import Base
+from .utils import format_cryptoperiod
+
+
+def new_ulid() -> str:
+    # Column default for ULID identifiers
+    return str(ulid.new())
+
+
+def utc_now() -> datetime:
+    # Column default for timestamps
+    return datetime.now(timezone.utc)
 
 
 class KeyTypeStatus(Enum):
@@ -18,21 +29,24 @@ class KeyTypeStatus(Enum):
 
 class KeyType(Base):
     __tablename__ = "key_types"
+    __table_args__ = (
+        # Backs the algorithm / size_bits filters of the KeyType list
+        Index("ix_key_types_algorithm_size_bits", "algorithm", "size_bits"),
+    )
 
 
-    id: Mapped[int] = Column(Integer, primary_key=True,
-                         index=True)  # type: ignore
-    key_type_corr_id = Column(String, default=lambda: str(ulid.new()), unique=True, index=True)  # type: ignore
-    name: Mapped[str] = Column(String, unique=True, index=True)  # type: ignore
-    description: Mapped[str] = Column(String)  # type: ignore
-    algorithm: Mapped[str] = Column(String)  # type: ignore
+    id: Mapped[int] = Column(Integer, primary_key=True)  # type: ignore
+    key_type_corr_id = Column(String(26), default=new_ulid, unique=True, index=True)  # type: ignore
+    name: Mapped[str] = Column(String(100), unique=True, index=True)  # type: ignore
+    description: Mapped[str] = Column(String(250))  # type: ignore
+    algorithm: Mapped[str] = Column(String(50))  # type: ignore
     size_bits: Mapped[int] = Column(Integer)  # type: ignore
     # E.g., Acquirer, Vendor, etc.
-    generated_by: Mapped[str] = Column(String)  # type: ignore
+    generated_by: Mapped[str] = Column(String(100))  # type: ignore
     # E.g., # Components, Encrypted
-    form_factor: Mapped[str] = Column(String)  # type: ignore
+    form_factor: Mapped[str] = Column(String(100))  # type: ignore
     # Device, Acquirer, Vendor, etc.
-    uniqueness_scope: Mapped[str] = Column(String)  # type: ignore
+    uniqueness_scope: Mapped[str] = Column(String(100))  # type: ignore
     # Store cryptoperiod in days
     cryptoperiod_days: Mapped[int] = Column(Integer)  # type: ignore
     # Relationship with CryptoKey
@@ -42,7 +56,10 @@ class KeyType(Base):
     status: Mapped[KeyTypeStatus] = Column(SQLAlchemyEnum(KeyTypeStatus),
                                            default=KeyTypeStatus.ACTIVE)  # type: ignore
 
-    crypto_keys = relationship("CryptoKey", back_populates="key_type")
+    @property
+    def cryptoperiod(self) -> str:
+        # User-friendly cryptoperiod, mirrors KeyTypeSchema.cryptoperiod
+        return format_cryptoperiod(self.cryptoperiod_days)
 
 
 class KeyStatus(Enum):
@@ -62,49 +79,64 @@ class KeyStatus(Enum):
 
 class CryptoKey(Base):
     __tablename__ = "crypto_keys"
-
-    id: Mapped[int] = Column(Integer, primary_key=True,
-                             index=True)  # type: ignore
-    key_corr_id: Mapped[str] = Column(String, unique=True, default=lambda: str(
-        ulid.new()), index=True)  # type: ignore  # ULID as unique identifier
+    __table_args__ = (
+        # Backs the periodic expiration sweep
+        Index("ix_crypto_keys_status_expiration_date", "status", "expiration_date"),
+        # Filters a KeyType's keys and pages through them in cursor order without a sort step
+        Index("ix_crypto_keys_key_type_corr_id_key_corr_id", "key_type_corr_id", "key_corr_id"),
+        # Backs the generating_entity filter of the CryptoKey list
+        Index("ix_crypto_keys_generating_entity", "generating_entity"),
+    )
+
+    id: Mapped[int] = Column(Integer, primary_key=True)  # type: ignore
+    # ULID as unique identifier
+    key_corr_id: Mapped[str] = Column(
+        String(26), unique=True, default=new_ulid, index=True)  # type: ignore
 
     key_type_corr_id: Mapped[str] = Column(
-        String, ForeignKey("key_types.key_type_corr_id"))  # type: ignore
-    description: Mapped[str] = Column(String)  # type: ignore
-    generating_entity: Mapped[str] = Column(String)  # type: ignore
-    generation_method: Mapped[str] = Column(String)  # type: ignore
-    storage_location: Mapped[str] = Column(String)  # type: ignore
-    encryption_under_lmk: Mapped[str] = Column(String)  # type: ignore
-    form_factor: Mapped[str] = Column(String)  # type: ignore
-    scope_of_uniqueness: Mapped[str] = Column(String)  # type: ignore
-    usage_purpose: Mapped[str] = Column(String)  # type: ignore
-    operational_environment: Mapped[str] = Column(String)  # type: ignore
-    associated_parties: Mapped[str] = Column(String)  # type: ignore
+        String(26), ForeignKey("key_types.key_type_corr_id"))  # type: ignore
+    description: Mapped[str] = Column(String(250))  # type: ignore
+    generating_entity: Mapped[str] = Column(String(100))  # type: ignore
+    generation_method: Mapped[str] = Column(String(50))  # type: ignore
+    storage_location: Mapped[str] = Column(String(100))  # type: ignore
+    encryption_under_lmk: Mapped[str] = Column(String(50))  # type: ignore
+    form_factor: Mapped[str] = Column(String(100))  # type: ignore
+    scope_of_uniqueness: Mapped[str] = Column(String(100))  # type: ignore
+    usage_purpose: Mapped[str] = Column(String(100))  # type: ignore
+    operational_environment: Mapped[str] = Column(String(100))  # type: ignore
+    associated_parties: Mapped[str] = Column(String(250))  # type: ignore
     activation_date: Mapped[datetime] = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc))  # type: ignore
+        DateTime, default=utc_now)  # type: ignore
     intended_lifetime: Mapped[str] = Column(String)  # type: ignore
     status: Mapped[KeyStatus] = Column(SQLAlchemyEnum(
         KeyStatus), default=KeyStatus.ACTIVE)  # type: ignore
     expiration_date: Mapped[datetime | None] = Column(
         DateTime, nullable=True)  # type: ignore
-    access_control_mechanisms: Mapped[str] = Column(String)  # type: ignore
-    compliance_requirements: Mapped[str] = Column(String)  # type: ignore
-    audit_log_reference: Mapped[str] = Column(String)  # type: ignore
-    backup_and_recovery_details: Mapped[str] = Column(String)  # type: ignore
-    notes: Mapped[str] = Column(String)  # type: ignore
+    access_control_mechanisms: Mapped[str] = Column(String(250))  # type: ignore
+    compliance_requirements: Mapped[str] = Column(String(250))  # type: ignore
+    audit_log_reference: Mapped[str] = Column(String(100))  # type: ignore
+    backup_and_recovery_details: Mapped[str] = Column(String(250))  # type: ignore
+    notes: Mapped[str] = Column(String(500))  # type: ignore
     justification: Mapped[str] = Column(String, nullable=False)  # type: ignore
     timestamp: Mapped[datetime] = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc))  # type: ignore
+        DateTime, default=utc_now)  # type: ignore
 
     # Relationship with KeyType
     key_type: Mapped["KeyType"] = relationship(
         "KeyType", back_populates="crypto_keys")  # type: ignore
 
 
-ALLOWED_TRANSITIONS = {
-    KeyStatus.ACTIVE: {KeyStatus.SUSPENDED, KeyStatus.COMPROMISED, KeyStatus.EXPIRED},
-    KeyStatus.SUSPENDED: {KeyStatus.ACTIVE, KeyStatus.EXPIRED, KeyStatus.DESTROYED},
-    KeyStatus.COMPROMISED: {KeyStatus.DESTROYED},
-    KeyStatus.EXPIRED: {KeyStatus.DESTROYED},
-    KeyStatus.DESTROYED: set()  # No transitions allowed from Destroyed
+ALLOWED_TRANSITIONS: dict[KeyStatus, frozenset[KeyStatus]] = {
+    KeyStatus.ACTIVE: frozenset({KeyStatus.SUSPENDED, KeyStatus.COMPROMISED, KeyStatus.EXPIRED}),
+    KeyStatus.SUSPENDED: frozenset({KeyStatus.ACTIVE, KeyStatus.EXPIRED, KeyStatus.DESTROYED}),
+    KeyStatus.COMPROMISED: frozenset({KeyStatus.DESTROYED}),
+    KeyStatus.EXPIRED: frozenset({KeyStatus.DESTROYED}),
+    KeyStatus.DESTROYED: frozenset()  # No transitions allowed from Destroyed
 }
+# Every allowed (current, new) status pair, so a transition check is a single set lookup
+ALLOWED_TRANSITION_PAIRS: frozenset[tuple[KeyStatus, KeyStatus]] = frozenset(
+    (current, new) for current, targets in ALLOWED_TRANSITIONS.items() for new in targets
+)
+
+# Configure the mappers once at import so a misconfigured relationship fails here, not on first use
+configure_mappers()
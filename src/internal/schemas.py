@@ -1,18 +1,30 @@
 # schemas.py
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, SerializationInfo, field_serializer, field_validator, model_validator
+from pydantic import (AfterValidator, BaseModel, ConfigDict, Field, SerializationInfo,
+                      StringConstraints, TypeAdapter, field_serializer, field_validator, model_validator)
 
 from .models import KeyStatus, KeyTypeStatus
-from .utils import format_cryptoperiod, parse_cryptoperiod, validate_cryptoperiod_days
+from .utils import format_cryptoperiod, parse_cryptoperiod_unchecked, validate_cryptoperiod_days
+
+
+def _check_cryptoperiod(value: str) -> str:
+    # The pattern has already been enforced, so skip the format checks
+    validate_cryptoperiod_days(parse_cryptoperiod_unchecked(value))
+    return value
+
+
+# Cryptoperiod input such as '30d', '6m' or '1y', capped at MAX_EXPIRY_DAYS
+CryptoperiodStr = Annotated[str, StringConstraints(pattern=r"^\d+[dmy]$"), AfterValidator(_check_cryptoperiod)]
 
 
 class KeyTypeBaseSchema(BaseModel):
 
     model_config = ConfigDict(use_enum_values=True,
                               from_attributes=True,
-                              populate_by_name=True)
+                              populate_by_name=True,
+                              frozen=True)
 
     name: str = Field(...,
                       max_length=100,
@@ -56,30 +68,21 @@ class KeyTypeBaseSchema(BaseModel):
                                   max_length=100,
                                   description="Scope of uniqueness (e.g., device, application)",
                                   examples=["Unique per logical configuration", "Unique per client", "Unique per device"])
-    cryptoperiod: str = Field(...,
-                              pattern=r"^\d+[dmy]$",
-                              description="Cryptoperiod in format like '30d', '6m', '1y'",
-                              examples=["1y", "6m", "30d"])
+    cryptoperiod: CryptoperiodStr = Field(...,
+                                          description="Cryptoperiod in format like '30d', '6m', '1y'",
+                                          examples=["1y", "6m", "30d"])
 
 class KeyTypeCreateSchema(KeyTypeBaseSchema):
 
-    @model_validator(mode="before")
-    def parse_cryptoperiod_input(cls, values):
-        if isinstance(values, dict):
-            d = values
-        else:
-            d = values.__dict__
-        cryptoperiod = d.get("cryptoperiod")
-        if cryptoperiod:
-            days = parse_cryptoperiod(cryptoperiod)
-            validate_cryptoperiod_days(days)
-        return values
+    # Request body: reject unknown fields rather than silently dropping them
+    model_config = ConfigDict(extra="forbid")
 
 class KeyTypeSchema(KeyTypeBaseSchema):
 
     model_config = ConfigDict(use_enum_values=True,
                               from_attributes=True,
-                              populate_by_name=True)
+                              populate_by_name=True,
+                              frozen=True)
 
     key_type_corr_id: str = Field(...,
                         description="ULID key identifier",
@@ -91,14 +94,9 @@ class KeyTypeSchema(KeyTypeBaseSchema):
 
     @model_validator(mode="before")
     def format_cryptoperiod_output(cls, values):
-        if isinstance(values, dict):
-            d = values
-        else:
-            d = values.__dict__
-
-        if "cryptoperiod_days" in d:
-            d['cryptoperiod'] = format_cryptoperiod(
-                d['cryptoperiod_days'])
+        # KeyType models expose `cryptoperiod` themselves; only plain dicts need it derived
+        if isinstance(values, dict) and "cryptoperiod" not in values and "cryptoperiod_days" in values:
+            return {**values, "cryptoperiod": format_cryptoperiod(values["cryptoperiod_days"])}
         return values
 
 
@@ -118,7 +116,8 @@ class CryptoKeyBaseSchema(BaseModel):
 
     model_config = ConfigDict(use_enum_values=True,
                               from_attributes=True,
-                              populate_by_name=True)
+                              populate_by_name=True,
+                              frozen=True)
 
 
     key_type_corr_id: str = Field(..., description="ULID of the associated KeyType")
@@ -216,10 +215,9 @@ def serialize_activation_date(self, activation_date: datetime, info: Serializati
 
     @model_validator(mode="after") # type: ignore
     def check_dates(cls, values: "CryptoKeyBaseSchema"):
-        d = values.model_dump()
-
-        activation_date = d.get("activation_date")
-        rotation_date = d.get("expiration_date")
+        # Read the two fields directly rather than dumping the whole model
+        activation_date = values.activation_date
+        rotation_date = getattr(values, "expiration_date", None)
         if activation_date and rotation_date:
             if activation_date > rotation_date:
                 raise ValueError(
@@ -230,7 +228,10 @@ class CryptoKeyCreateSchema(BaseModel):
 
     model_config = ConfigDict(use_enum_values=True,
                               from_attributes=True,
-                              populate_by_name=True)
+                              populate_by_name=True,
+                              frozen=True,
+                              # Request body: reject unknown fields rather than silently dropping them
+                              extra="forbid")
 
     key_type_corr_id: str = Field(..., description="ULID of the associated KeyType")
 
@@ -364,8 +365,8 @@ def serialize_timestamp(self, timestamp: datetime, info: SerializationInfo) -> s
         return timestamp.isoformat()
 
     @field_serializer("expiration_date", when_used="json")
-    def serialize_expiration_date(self, expiration_date: datetime, info: SerializationInfo) -> str:
-        return expiration_date.isoformat()
+    def serialize_expiration_date(self, expiration_date: Optional[datetime], info: SerializationInfo) -> Optional[str]:
+        return expiration_date.isoformat() if expiration_date else None
 
 
 class KeyHistorySchema(BaseModel):
@@ -384,3 +385,8 @@ class KeyHistorySchema(BaseModel):
     def serialize_timestamp(self, timestamp: datetime, info: SerializationInfo) -> str:
         return timestamp.isoformat()
 
+
+# Validate or serialise whole lists in one pydantic-core pass instead of once per item
+KEY_TYPE_LIST_ADAPTER = TypeAdapter(list[KeyTypeSchema])
+CRYPTO_KEY_LIST_ADAPTER = TypeAdapter(list[CryptoKeySchema])
+KEY_HISTORY_LIST_ADAPTER = TypeAdapter(list[KeyHistorySchema])
@@ -1,17 +1,23 @@
 # utils.py
-import re
+from functools import lru_cache
+from typing import Final
 
 from .config import MAX_EXPIRY_DAYS
 
 # Constants for days per month and year for approximate conversions
-DAYS_IN_MONTH = 30
-DAYS_IN_YEAR = 365
+DAYS_IN_MONTH: Final[int] = 30
+DAYS_IN_YEAR: Final[int] = 365
+
+_DAYS_PER_UNIT = {"d": 1, "m": DAYS_IN_MONTH, "y": DAYS_IN_YEAR}
+# Units tried by format_cryptoperiod, largest first
+_FORMAT_UNITS = ((DAYS_IN_YEAR, "y"), (DAYS_IN_MONTH, "m"))
 
 def validate_cryptoperiod_days(days: int) -> None:
     if days > MAX_EXPIRY_DAYS:
         period = format_cryptoperiod(days)
         raise ValueError(f"Cryptoperiod days cannot exceed {period}")
 
+@lru_cache(maxsize=128)
 def parse_cryptoperiod(period_str: str) -> int:
     """
     Converts a cryptoperiod string like '30d', '6m', '1y' into days.
@@ -29,22 +35,25 @@ def parse_cryptoperiod(period_str: str) -> int:
     Raises:
         ValueError: If the format is incorrect or contains unsupported units.
     """
-    match = re.match(r"(\d+)([dmy])", period_str.strip().lower())
-    if not match:
+    # The grammar is just digits plus a unit suffix, so dispatch on the suffix instead of running a regex
+    normalized = period_str.strip().lower()
+    value, unit = normalized[:-1], normalized[-1:]
+    multiplier = _DAYS_PER_UNIT.get(unit)
+    # isascii() + isdigit() keeps int() from accepting signs, underscores, whitespace or non-ASCII digits
+    if multiplier is None or not (value.isascii() and value.isdigit()):
         raise ValueError(f"Invalid cryptoperiod format: {period_str}")
 
-    value, unit = match.groups()
-    value = int(value)
+    return int(value) * multiplier
+
+def parse_cryptoperiod_unchecked(period_str: str) -> int:
+    """
+    Converts a cryptoperiod string already validated against the schema pattern into days.
 
-    if unit == 'd':
-        return value
-    elif unit == 'm':
-        return value * DAYS_IN_MONTH
-    elif unit == 'y':
-        return value * DAYS_IN_YEAR
-    else:
-        raise ValueError(f"Unsupported time unit '{unit}' in cryptoperiod: {period_str}")
+    Skips the format checks; use parse_cryptoperiod for untrusted input.
+    """
+    return int(period_str[:-1]) * _DAYS_PER_UNIT[period_str[-1]]
 
+@lru_cache(maxsize=128)
 def format_cryptoperiod(days: int) -> str:
     """
     Converts a number of days into a readable cryptoperiod string,
@@ -56,9 +65,7 @@ def format_cryptoperiod(days: int) -> str:
     Returns:
         str: A formatted cryptoperiod like '6m' or '1y'.
     """
-    if days >= DAYS_IN_YEAR and days % DAYS_IN_YEAR == 0:
-        return f"{days // DAYS_IN_YEAR}y"
-    elif days >= DAYS_IN_MONTH and days % DAYS_IN_MONTH == 0:
-        return f"{days // DAYS_IN_MONTH}m"
-    else:
-        return f"{days}d"
+    for unit_days, unit in _FORMAT_UNITS:
+        if days >= unit_days and days % unit_days == 0:
+            return f"{days // unit_days}{unit}"
+    return f"{days}d"
@@ -1,17 +1,13 @@
 #!/usr/bin/env python3
 # main.py
 
-import asyncio
+import os
 
 import uvicorn
 
 from app import app
 
-
-async def main() -> None:
-    config = uvicorn.Config("main:app", port=8000, log_level="info", reload=True)
-    server = uvicorn.Server(config)
-    await server.serve()
-
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Auto-reload is for development only and runs a single process. Otherwise uvicorn
+    # starts WEB_CONCURRENCY worker processes, and uses uvloop and httptools when installed.
+    uvicorn.run("main:app", port=8000, log_level="info", reload=os.getenv("RELOAD") == "1")
@@ -1,22 +1,48 @@
-import tempfile
 from datetime import datetime, timedelta, timezone
 
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from internal.database import Base
 from internal.models import CryptoKey, KeyStatus, KeyType
 
 
+@pytest.fixture(scope="session")
+def crypto_key_payload() -> dict:
+    """
+    A valid CryptoKey request body for the prepopulated KeyType. Override fields with {**crypto_key_payload, ...}.
+    """
+    return {
+        "key_type_corr_id": "01F8MECHZX3TBDSZ7XRADM79XV",
+        "description": "Payload CryptoKey",
+        "generating_entity": "Test Entity",
+        "generation_method": "HSM",
+        "storage_location": "Test Location",
+        "encryption_under_lmk": "-",
+        "form_factor": "HSM",
+        "scope_of_uniqueness": "Test Scope",
+        "usage_purpose": "Test Purpose",
+        "operational_environment": "Test Env",
+        "associated_parties": "Test Parties",
+        "access_control_mechanisms": "Test Mechanisms",
+        "compliance_requirements": "Test Compliance",
+        "audit_log_reference": "Test Log",
+        "backup_and_recovery_details": "Test Backup",
+        "notes": "Test Notes",
+    }
+
+
 @pytest.fixture(scope="session")
 def test_db():
     """
-    Set up a file-based SQLite database for testing that persists throughout the test session.
+    Set up an in-memory SQLite database for testing that persists throughout the test session.
     """
-    # Create a temporary file for the SQLite database
-    temp_db = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
-    engine = create_engine(f"sqlite:///{temp_db.name}")
+    # StaticPool keeps the single in-memory connection alive, so every session sees the same database
+    engine = create_engine("sqlite://",
+                           connect_args={"check_same_thread": False},
+                           poolclass=StaticPool)
     TestingSessionLocal = sessionmaker(
         autocommit=False, autoflush=False, bind=engine)
 
@@ -26,9 +52,12 @@ def test_db():
     # Initialize session
     db = TestingSessionLocal()
 
-    # Prepopulate the database with test data
+    # Prepopulate the database with test data.
+    # One timestamp for the whole seed keeps activation_date == timestamp deterministic.
+    now = datetime.now(timezone.utc)
+    seed_id = "01F8MECHZX3TBDSZ7XRADM79XV"
     key_type = KeyType(
-        key_type_corr_id="01F8MECHZX3TBDSZ7XRADM79XV",
+        key_type_corr_id=seed_id,
         name="Test KeyType",
         description="A test key type",
         algorithm="AES",
@@ -39,8 +68,8 @@ def test_db():
         cryptoperiod_days=365,
     )
     crypto_key = CryptoKey(
-        key_corr_id="01F8MECHZX3TBDSZ7XRADM79XV",
-        key_type_corr_id="01F8MECHZX3TBDSZ7XRADM79XV",
+        key_corr_id=seed_id,
+        key_type_corr_id=seed_id,
         description="Test CryptoKey",
         generating_entity="Test Entity",
         generation_method="HSM",
@@ -51,9 +80,9 @@ def test_db():
         usage_purpose="Test Purpose",
         operational_environment="Test Env",
         associated_parties="Test Parties",
-        activation_date=datetime.now(timezone.utc),
+        activation_date=now,
         intended_lifetime="1y",
-        expiration_date=datetime.now(timezone.utc) + timedelta(days=365),
+        expiration_date=now + timedelta(days=365),
         status=KeyStatus.ACTIVE,
         access_control_mechanisms="Test Mechanisms",
         compliance_requirements="Test Compliance",
@@ -61,7 +90,7 @@ def test_db():
         backup_and_recovery_details="Test Backup",
         notes="Test Notes",
         justification="Test Justification",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now,
     )
     db.add(key_type)
     db.add(crypto_key)
@@ -72,4 +101,4 @@ def test_db():
     # Teardown: Drop tables and close the engine
     db.close()
     Base.metadata.drop_all(bind=engine)
-    temp_db.close()
+    engine.dispose()
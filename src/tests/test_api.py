@@ -1,12 +1,14 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from internal.config import BULK_CREATE_MAX_KEYS
+
 from ..app import app, get_db
 
 # Override the get_db dependency with the test database session
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def override_get_db(test_db):
     """
     Override FastAPI's get_db dependency with the test database session.
@@ -17,32 +19,176 @@ def _override_get_db():
     return _override_get_db
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def client(override_get_db):
-    # Override FastAPI's get_db dependency
+    # Override FastAPI's get_db dependency and run the app lifespan once for the whole session.
+    # Tests that add rows remove them again, so the shared client sees a consistent database.
     app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
 
 
-def test_get_key_types(client) -> None:
-    # When: Making a GET request to /key-types/
-    response = client.get("/key-types/")
+@pytest.mark.parametrize("path, expected", [
+    ("/key-types/", {"name": "Test KeyType", "cryptoperiod": "1y"}),
+    ("/keys/", {"description": "Test CryptoKey"}),
+])
+def test_get_list(client, path, expected) -> None:
+    # When: Making a GET request to the list endpoint
+    response = client.get(path)
+
+    # Then: The response should include the prepopulated item
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    for field, value in expected.items():
+        assert data[0][field] == value
+
+
+def test_get_key_type_not_modified(client) -> None:
+    # Given: A KeyType the client has already fetched
+    response = client.get("/key-types/01F8MECHZX3TBDSZ7XRADM79XV")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    # When: Fetching it again with its ETag
+    response = client.get("/key-types/01F8MECHZX3TBDSZ7XRADM79XV", headers={"If-None-Match": etag})
+
+    # Then: The server should answer 304 without a body
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # When/Then: A weak form of the same ETag should match as well
+    response = client.get("/key-types/01F8MECHZX3TBDSZ7XRADM79XV", headers={"If-None-Match": f"W/{etag}"})
+    assert response.status_code == 304
+
+
+def test_get_key_types_cursor_pagination(client) -> None:
+    # When: Requesting a full first page
+    response = client.get("/key-types/", params={"limit": 1})
+
+    # Then: The response should point at the next page
+    assert response.status_code == 200
+    cursor = response.headers["X-Next-Cursor"]
+    assert cursor == "01F8MECHZX3TBDSZ7XRADM79XV"
+
+    # When: Following the cursor
+    response = client.get("/key-types/", params={"limit": 1, "after": cursor})
+
+    # Then: No rows remain and there is no further cursor
+    assert response.status_code == 200
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_get_crypto_keys_ordered_has_no_cursor(client) -> None:
+    # When: Requesting a full page in a custom order
+    response = client.get("/keys/", params={"limit": 1, "order_by": "-description"})
+
+    # Then: No cursor should be offered, since cursors only follow ULID order
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_get_crypto_keys_filtered_by_key_type(client) -> None:
+    # When: Filtering CryptoKeys by the prepopulated KeyType
+    response = client.get("/keys/", params={"key_type_id": "01F8MECHZX3TBDSZ7XRADM79XV"})
 
-    # Then: The response should include the prepopulated KeyType
+    # Then: The key of that KeyType should be returned
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 1
-    assert data[0]["name"] == "Test KeyType"
+    assert data[0]["key_type_corr_id"] == "01F8MECHZX3TBDSZ7XRADM79XV"
+
+
+def test_create_crypto_key_with_unknown_key_type(client, crypto_key_payload) -> None:
+    # Given: A CryptoKey payload referencing a KeyType that does not exist
+    payload = {**crypto_key_payload,
+               "key_type_corr_id": "01JD6YMK922QG42Q1W24WR75W8",
+               "description": "Orphan CryptoKey"}
+
+    # When: Making a POST request to /keys/
+    response = client.post("/keys/", json=payload)
+
+    # Then: The request should be rejected without creating a key
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid key_type_id"
+
+
+def test_create_crypto_keys_bulk_with_unknown_key_type(client, crypto_key_payload) -> None:
+    # Given: A batch where one CryptoKey references a KeyType that does not exist
+    payload = {**crypto_key_payload, "description": "Bulk CryptoKey"}
+    orphan = {**payload, "key_type_corr_id": "01JD6YMK922QG42Q1W24WR75W8"}
+
+    # When: Making a POST request to /keys/bulk
+    response = client.post("/keys/bulk", json=[payload, orphan])
+
+    # Then: The whole batch should be rejected, naming the unknown KeyType
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid key_type_id: 01JD6YMK922QG42Q1W24WR75W8"
+    assert len(client.get("/keys/").json()) == 1
+
+
+def test_create_crypto_keys_bulk_rejects_oversized_batch(client, crypto_key_payload) -> None:
+    # Given: One more CryptoKey than a single bulk request may hold
+    payload = [crypto_key_payload] * (BULK_CREATE_MAX_KEYS + 1)
+
+    # When: Making a POST request to /keys/bulk
+    response = client.post("/keys/bulk", json=payload)
 
+    # Then: The request should fail validation before any key is written
+    assert response.status_code == 422
+    assert len(client.get("/keys/").json()) == 1
 
-def test_get_crypto_keys(client) -> None:
-    # When: Making a GET request to /keys/
-    response = client.get("/keys/")
 
-    # Then: The response should include the prepopulated CryptoKey
+def test_create_key_type_rejects_unknown_fields(client) -> None:
+    # Given: A KeyType payload with a field the schema does not define
+    payload = {
+        "name": "Unknown Field Key Type",
+        "description": "Test description",
+        "algorithm": "AES",
+        "size_bits": 256,
+        "generated_by": "Test Generator",
+        "form_factor": "Test Form",
+        "uniqueness_scope": "Test Scope",
+        "cryptoperiod": "1y",
+        "cryptoperiod_days": 365,
+    }
+
+    # When: Making a POST request to /key-types/
+    response = client.post("/key-types/", json=payload)
+
+    # Then: The request should fail validation instead of silently dropping the field
+    assert response.status_code == 422
+    assert len(client.get("/key-types/").json()) == 1
+
+
+def test_get_key_types_rejects_non_column_order_by(client) -> None:
+    # When: Ordering by a relationship rather than a column
+    response = client.get("/key-types/", params={"order_by": "-crypto_keys"})
+
+    # Then: The request should be rejected
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid order_by field: crypto_keys"
+
+
+def test_get_key_history(client) -> None:
+    # When: Making a GET request to /keys/{id}/history
+    response = client.get("/keys/01F8MECHZX3TBDSZ7XRADM79XV/history")
+
+    # Then: The response should include the prepopulated CryptoKey record
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 1
-    assert data[0]["description"] == "Test CryptoKey"
+    assert data[0]["key_corr_id"] == "01F8MECHZX3TBDSZ7XRADM79XV"
+    assert data[0]["status"] == "Active"
+
+
+def test_delete_key_type_with_associated_keys(client) -> None:
+    # When: Deleting a KeyType that still has an active CryptoKey without force
+    response = client.delete("/key-types/01F8MECHZX3TBDSZ7XRADM79XV")
+
+    # Then: The request should be rejected and the KeyType kept
+    assert response.status_code == 400
+    assert client.get("/key-types/01F8MECHZX3TBDSZ7XRADM79XV").status_code == 200
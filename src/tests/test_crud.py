@@ -1,28 +1,233 @@
-from internal.crud import get_crypto_key_by_id, get_key_type_by_id
-from internal.models import KeyStatus
+from datetime import datetime, timedelta, timezone
 
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import InvalidRequestError
 
-def test_get_key_type_by_id(test_db) -> None:
-    # Given: A prepopulated database with a KeyType
-    key_type_id = "01F8MECHZX3TBDSZ7XRADM79XV"
+from internal.crud import (check_and_expire_keys, create_crypto_key, create_crypto_keys_bulk, create_key_type,
+                           delete_key_type, get_crypto_key_by_id, get_key_type_by_id, get_key_type_cryptoperiod_days,
+                           get_latest_key_version, update_key_status)
+from internal.models import CryptoKey, KeyStatus, KeyType
+from internal.schemas import CryptoKeyCreateSchema, KeyTypeCreateSchema
 
-    # When: Retrieving the KeyType by ID
-    result = get_key_type_by_id(test_db, key_type_id)
 
-    # Then: The correct KeyType should be returned
+@pytest.mark.parametrize("getter, expected", [
+    (get_key_type_by_id, {"name": "Test KeyType", "algorithm": "AES"}),
+    (get_crypto_key_by_id, {"description": "Test CryptoKey", "status": KeyStatus.ACTIVE.value}),
+])
+def test_get_by_id(test_db, getter, expected) -> None:
+    # Given: A prepopulated database with a KeyType and a CryptoKey sharing the same ULID
+    item_id = "01F8MECHZX3TBDSZ7XRADM79XV"
+
+    # When: Retrieving the item by ID
+    result = getter(test_db, item_id)
+
+    # Then: The correct item should be returned
     assert result is not None
-    assert result.name == "Test KeyType"
-    assert result.algorithm == "AES"
+    for field, value in expected.items():
+        assert getattr(result, field) == value
+
+
+def test_check_and_expire_keys(test_db) -> None:
+    # Given: An active CryptoKey whose expiration date has passed
+    now = datetime.now(timezone.utc)
+    expired_key = CryptoKey(
+        key_corr_id="01F8MECHZX3TBDSZ7XRADM79XW",
+        key_type_corr_id="01F8MECHZX3TBDSZ7XRADM79XV",
+        description="Expired CryptoKey",
+        generating_entity="Test Entity",
+        generation_method="HSM",
+        storage_location="Test Location",
+        encryption_under_lmk="-",
+        form_factor="HSM",
+        scope_of_uniqueness="Test Scope",
+        usage_purpose="Test Purpose",
+        operational_environment="Test Env",
+        associated_parties="Test Parties",
+        activation_date=now - timedelta(days=2),
+        intended_lifetime="1d",
+        expiration_date=now - timedelta(days=1),
+        status=KeyStatus.ACTIVE,
+        access_control_mechanisms="Test Mechanisms",
+        compliance_requirements="Test Compliance",
+        audit_log_reference="Test Log",
+        backup_and_recovery_details="Test Backup",
+        notes="Test Notes",
+        justification="Test Justification",
+        timestamp=now,
+    )
+    test_db.add(expired_key)
+    test_db.commit()
+
+    try:
+        # When: Running the expiration check
+        check_and_expire_keys(test_db)
 
+        # Then: Only the expired key should be marked as expired
+        expired = get_crypto_key_by_id(test_db, "01F8MECHZX3TBDSZ7XRADM79XW")
+        active = get_crypto_key_by_id(test_db, "01F8MECHZX3TBDSZ7XRADM79XV")
+        assert expired is not None and active is not None
+        assert expired.status == KeyStatus.EXPIRED.value # type: ignore
+        assert active.status == KeyStatus.ACTIVE.value # type: ignore
+    finally:
+        test_db.delete(expired_key)
+        test_db.commit()
 
-def test_get_crypto_key_by_id(test_db) -> None:
-    # Given: A prepopulated database with a CryptoKey
+
+def test_update_key_status_creates_new_version(test_db) -> None:
+    # Given: A prepopulated database with an active CryptoKey
     crypto_key_id = "01F8MECHZX3TBDSZ7XRADM79XV"
 
-    # When: Retrieving the CryptoKey by ID
-    result = get_crypto_key_by_id(test_db, crypto_key_id)
+    # When: Suspending the CryptoKey
+    result = update_key_status(test_db, crypto_key_id, KeyStatus.SUSPENDED, "Test suspension")
+
+    try:
+        # Then: A new version carrying the original attributes should be returned
+        assert result.status == KeyStatus.SUSPENDED.value # type: ignore
+        assert result.description == "Test CryptoKey"
+        assert result.key_type_corr_id == "01F8MECHZX3TBDSZ7XRADM79XV"
+        assert result.intended_lifetime == "1y"
+    finally:
+        test_db.query(CryptoKey).filter(CryptoKey.key_corr_id == result.key_corr_id).delete()
+        test_db.commit()
+
+
+def test_create_key_type(test_db) -> None:
+    # Given: A valid KeyType payload
+    key_type = KeyTypeCreateSchema(
+        name="Created KeyType",
+        description="A created key type",
+        algorithm="AES",
+        size_bits=128,
+        generated_by="Test Generator",
+        form_factor="HSM",
+        uniqueness_scope="Test Scope",
+        cryptoperiod="6m",
+    )
+
+    # When: Creating the KeyType
+    result = create_key_type(test_db, key_type)
+
+    try:
+        # Then: The stored KeyType should be returned with its generated identifier
+        assert result.name == "Created KeyType"
+        assert result.cryptoperiod == "6m"
+        assert len(result.key_type_corr_id) == 26
+
+        # And: Creating it again should be rejected as a duplicate, not a server error
+        with pytest.raises(HTTPException) as exc_info:
+            create_key_type(test_db, key_type)
+        assert exc_info.value.status_code == 400
+    finally:
+        test_db.query(KeyType).filter(KeyType.key_type_corr_id == result.key_type_corr_id).delete()
+        test_db.commit()
+
+
+def test_disabled_key_type_cryptoperiod_is_not_resolved(test_db) -> None:
+    # Given: A KeyType whose cryptoperiod has been looked up and cached
+    key_type = KeyTypeCreateSchema(
+        name="Disabled KeyType",
+        description="A key type to disable",
+        algorithm="AES",
+        size_bits=128,
+        generated_by="Test Generator",
+        form_factor="HSM",
+        uniqueness_scope="Test Scope",
+        cryptoperiod="30d",
+    )
+    result = create_key_type(test_db, key_type)
+
+    try:
+        assert get_key_type_cryptoperiod_days(test_db, result.key_type_corr_id) == 30
+
+        # When: Disabling the KeyType
+        delete_key_type(test_db, result.key_type_corr_id)
+
+        # Then: New keys should no longer resolve its cryptoperiod
+        assert get_key_type_cryptoperiod_days(test_db, result.key_type_corr_id) is None
+    finally:
+        test_db.query(KeyType).filter(KeyType.key_type_corr_id == result.key_type_corr_id).delete()
+        test_db.commit()
+
+
+def test_create_crypto_keys_bulk_rejects_disabled_key_type(test_db, crypto_key_payload) -> None:
+    # Given: A KeyType that has been disabled
+    key_type = KeyTypeCreateSchema(
+        name="Disabled Bulk KeyType",
+        description="A key type to disable",
+        algorithm="AES",
+        size_bits=128,
+        generated_by="Test Generator",
+        form_factor="HSM",
+        uniqueness_scope="Test Scope",
+        cryptoperiod="30d",
+    )
+    result = create_key_type(test_db, key_type)
+    delete_key_type(test_db, result.key_type_corr_id)
+
+    try:
+        # When: Bulk creating a key against it
+        crypto_key = CryptoKeyCreateSchema(**{**crypto_key_payload, "key_type_corr_id": result.key_type_corr_id})
+        with pytest.raises(HTTPException) as exc_info:
+            create_crypto_keys_bulk(test_db, [crypto_key])
+
+        # Then: The batch should be rejected without creating a key
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == f"Invalid key_type_id: {result.key_type_corr_id}"
+        assert test_db.query(CryptoKey).filter(CryptoKey.key_type_corr_id == result.key_type_corr_id).count() == 0
+    finally:
+        test_db.query(KeyType).filter(KeyType.key_type_corr_id == result.key_type_corr_id).delete()
+        test_db.commit()
+
+
+def test_create_crypto_key(test_db, crypto_key_payload) -> None:
+    # Given: A CryptoKey payload for the prepopulated KeyType with a one year cryptoperiod
+    activation_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    crypto_key = CryptoKeyCreateSchema(
+        **{**crypto_key_payload, "description": "Created CryptoKey", "activation_date": activation_date})
+
+    # When: Creating the CryptoKey
+    result = create_crypto_key(test_db, crypto_key)
+
+    try:
+        # Then: Lifetime and expiration should be derived from the KeyType
+        assert result.status == KeyStatus.ACTIVE.value # type: ignore
+        assert result.intended_lifetime == "1y"
+        assert result.expiration_date is not None
+        assert result.expiration_date.date() == (activation_date + timedelta(days=365)).date()
+    finally:
+        test_db.query(CryptoKey).filter(CryptoKey.key_corr_id == result.key_corr_id).delete()
+        test_db.commit()
+
+
+def test_create_crypto_keys_bulk(test_db, crypto_key_payload) -> None:
+    # Given: More CryptoKey payloads than fit in one insert batch
+    activation_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    crypto_keys = [
+        CryptoKeyCreateSchema(
+            **{**crypto_key_payload, "description": f"Bulk CryptoKey {i}", "activation_date": activation_date})
+        for i in range(3)
+    ]
+
+    # When: Creating them in batches of two
+    results = create_crypto_keys_bulk(test_db, crypto_keys, batch_size=2)
+
+    try:
+        # Then: Every key should be created, in order, with its own identifier
+        assert [result.description for result in results] == [f"Bulk CryptoKey {i}" for i in range(3)]
+        assert len({result.key_corr_id for result in results}) == 3
+        assert all(result.intended_lifetime == "1y" for result in results)
+    finally:
+        test_db.query(CryptoKey).filter(CryptoKey.key_corr_id.in_([r.key_corr_id for r in results])).delete()
+        test_db.commit()
+
+
+def test_strict_loading_rejects_lazy_relationship_access(test_db) -> None:
+    # Given: A CryptoKey loaded through the CRUD layer
+    crypto_key = get_latest_key_version(test_db, "01F8MECHZX3TBDSZ7XRADM79XV")
+    assert crypto_key is not None
+
+    # When/Then: Touching an unloaded relationship should raise instead of querying
+    with pytest.raises(InvalidRequestError):
+        crypto_key.key_type
 
-    # Then: The correct CryptoKey should be returned
-    assert result is not None
-    assert result.description == "Test CryptoKey"
-    assert result.status == KeyStatus.ACTIVE.value # type: ignore